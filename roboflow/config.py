@@ -73,6 +73,9 @@ TYPE_INSTANCE_SEGMENTATION = "instance-segmentation"
 TYPE_SEMANTIC_SEGMENTATION = "semantic-segmentation"
 TYPE_KEYPOINT_DETECTION = "keypoint-detection"
 
+# batched image uploads in the segmentation models' predict_batch need server support, so they are opt-in
+BATCH_PREDICT_ENABLED = str(get_conditional_configuration_variable("BATCH_PREDICT_ENABLED", "false")).lower() == "true"
+
 DEFAULT_BATCH_NAME = "Pip Package Upload"
 DEFAULT_JOB_NAME = "Annotated via API"
 
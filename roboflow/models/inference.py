@@ -1,20 +1,28 @@
+import asyncio
+import concurrent.futures
 import io
-import json
 import os
+import random
 import time
 import urllib
-from typing import Optional, Tuple
+from typing import Callable, Optional, Tuple
 from urllib.parse import urljoin
 
 import requests
 from PIL import Image
+from requests.adapters import HTTPAdapter
 from requests_toolbelt.multipart.encoder import MultipartEncoder
 from tqdm import tqdm
 
-from roboflow.config import API_URL
-from roboflow.util.image_utils import validate_image_path
+from roboflow.config import API_URL, BATCH_PREDICT_ENABLED
 from roboflow.util.prediction import PredictionGroup
 
+try:
+    import orjson
+except ImportError:
+    # orjson is an optional dependency, used to parse large prediction responses faster
+    orjson = None  # type: ignore[assignment]
+
 SUPPORTED_ROBOFLOW_MODELS = ["batch-video"]
 
 SUPPORTED_ADDITIONAL_MODELS = {
@@ -30,6 +38,126 @@ SUPPORTED_ADDITIONAL_MODELS = {
     },
 }
 
+HTTP_POOL_CONNECTIONS = 10
+HTTP_POOL_MAXSIZE = 20
+
+EXIF_ORIENTATION_TAG = 0x0112
+
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+VIDEO_POLL_INITIAL_DELAY = 2.0
+VIDEO_POLL_MAX_DELAY = 30.0
+VIDEO_POLL_BACKOFF_FACTOR = 1.5
+
+
+class _FileChunks:
+    """
+    Iterable over an open binary file that reads it in UPLOAD_CHUNK_SIZE pieces.
+
+    Exposing the length lets requests send a Content-Length header instead of
+    falling back to chunked transfer encoding.
+    """
+
+    def __init__(self, f, length, chunk_size=UPLOAD_CHUNK_SIZE):
+        self.f = f
+        self.length = length
+        self.chunk_size = chunk_size
+
+    def __len__(self):
+        return self.length
+
+    def __iter__(self):
+        return iter(lambda: self.f.read(self.chunk_size), b"")
+
+
+def _is_hosted(path):
+    """
+    Whether a path is an http(s) URL rather than a local file, matching the scheme case-insensitively.
+    """
+    return path.lower().startswith(("http://", "https://"))
+
+
+def _response_json(response):
+    """
+    Parse the JSON body of a requests or httpx response, with orjson when it is installed.
+    """
+    if orjson is None:
+        return response.json()
+    return orjson.loads(response.content)
+
+
+def _signed_url_expiry(signed_url):
+    """
+    Read the X-Goog-Expires value out of a signed upload URL.
+    """
+    return signed_url.split("&X-Goog-Expires")[1].split("&")[0].strip("=")
+
+
+def _video_job_state(data):
+    """
+    Map a videoinfer status payload to "running", "done" or "error".
+    """
+    status = data.get("status")
+    if status is None or status == 1:
+        return "running"  # no status available yet, or still running
+    if status > 1:
+        return "error"
+    return "done"
+
+
+def _next_poll_delay(delay, deadline, job_id):
+    """
+    Work out how long to sleep before the next video results poll.
+
+    Args:
+        delay (float): the current backoff delay in seconds
+        deadline (float): time.monotonic() value to give up at, or None to wait forever
+        job_id (str): the job being polled, for the timeout message
+
+    Returns:
+        Tuple of the jittered number of seconds to sleep and the backoff delay for the following poll
+
+    Raises:
+        TimeoutError: the deadline has passed
+    """
+    sleep_for = delay * random.uniform(0.8, 1.2)
+    if deadline is not None:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise TimeoutError(f"Timed out waiting for video inference results for job {job_id}")
+        sleep_for = min(sleep_for, remaining)
+    return sleep_for, min(delay * VIDEO_POLL_BACKOFF_FACTOR, VIDEO_POLL_MAX_DELAY)
+
+
+async def _aiter_file_chunks(f, chunk_size=UPLOAD_CHUNK_SIZE):
+    """
+    Read an open binary file in chunk_size pieces without blocking the event loop.
+    """
+    loop = asyncio.get_running_loop()
+    while True:
+        chunk = await loop.run_in_executor(None, f.read, chunk_size)
+        if not chunk:
+            break
+        yield chunk
+
+
+def _new_async_client():
+    try:
+        import httpx
+    except ImportError:
+        raise RuntimeError(
+            "The httpx python package is required for async video inference."
+            " Please install it with `pip install 'httpx[http2]'`"
+        )
+
+    # no timeout, matching the requests based methods, since video uploads can take a long time
+    client_kwargs = {"limits": httpx.Limits(max_keepalive_connections=HTTP_POOL_MAXSIZE), "timeout": None}
+    try:
+        return httpx.AsyncClient(http2=True, **client_kwargs)
+    except ImportError:
+        # httpx was installed without the http2 extra (the h2 package), fall back to HTTP/1.1
+        return httpx.AsyncClient(http2=False, **client_kwargs)
+
 
 class InferenceModel:
     def __init__(
@@ -51,6 +179,16 @@ class InferenceModel:
         self.__api_key = api_key
         self.id = version_id
 
+        # a shared session keeps connections alive across predict and polling calls
+        self._session = requests.Session()
+        # the adapter is mounted for both schemes so local inference servers get the same pool size
+        adapter = HTTPAdapter(pool_connections=HTTP_POOL_CONNECTIONS, pool_maxsize=HTTP_POOL_MAXSIZE)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+        self._auth_params = {"api_key": api_key}
+        self._signed_url_endpoint = urljoin(API_URL, "/video_upload_signed_url")
+        self._videoinfer_endpoint = urljoin(API_URL, "/videoinfer/")
+
         if version_id != "BASE_MODEL":
             version_info = self.id.rsplit("/")
             self.dataset_id = version_info[1]
@@ -65,31 +203,71 @@ class InferenceModel:
             image_path (str): path to the image you'd like to perform prediction on
 
         Returns:
-            Tuple containing a dict of querystring params and a dict of requests kwargs
+            Tuple containing a dict of querystring params, a dict of requests kwargs, a dict of image
+            dimensions and the file object being uploaded, which the caller closes once the request is
+            sent (None for hosted images)
 
         Raises:
             Exception: Image path is not valid
         """
-        validate_image_path(image_path)
-
-        hosted_image = urllib.parse.urlparse(image_path).scheme in ("http", "https")
-
-        if hosted_image:
+        # hosted images are fetched by the API, which reports invalid URLs itself
+        if _is_hosted(image_path):
             image_dims = {"width": "Undefined", "height": "Undefined"}
-            return {"image": image_path}, {}, image_dims
-
-        image = Image.open(image_path)
-        dimensions = image.size
-        image_dims = {"width": str(dimensions[0]), "height": str(dimensions[1])}
-        buffered = io.BytesIO()
-        image.save(buffered, quality=90, format="JPEG")
-        data = MultipartEncoder(fields={"file": ("imageToUpload", buffered.getvalue(), "image/jpeg")})
+            return {"image": image_path}, {}, image_dims, None
+
+        upload, image_dims = self.__encode_image(image_path)
+        data = MultipartEncoder(fields={"file": ("imageToUpload", upload, "image/jpeg")})
         return (
             {},
             {"data": data, "headers": {"Content-Type": data.content_type}},
             image_dims,
+            upload,
         )
 
+    def __encode_image(self, image_path):
+        """
+        Open a local image as a JPEG file object ready to be uploaded.
+
+        Args:
+            image_path (str): path to a local image
+
+        Returns:
+            Tuple containing a file object positioned at the start of the JPEG, which the caller must
+            close, and a dict of image dimensions
+
+        Raises:
+            Exception: Image path is not valid
+        """
+        # a single open serves as the existence check, the header read and the upload source
+        try:
+            f = open(image_path, "rb")
+        except FileNotFoundError:
+            raise Exception(f"Image does not exist at {image_path}!")
+
+        try:
+            # opening only parses the header, so size and format are read without decoding pixels
+            with Image.open(f) as image:
+                dimensions = image.size
+                image_dims = {"width": str(dimensions[0]), "height": str(dimensions[1])}
+                # an EXIF orientation tag would make the server rotate the image away from these dimensions,
+                # so only untagged JPEGs are sent as-is, the re-encode below drops the tag
+                passthrough = image.format == "JPEG" and image.getexif().get(EXIF_ORIENTATION_TAG, 1) == 1
+                if not passthrough:
+                    buffered = io.BytesIO()
+                    image.save(buffered, quality=90, format="JPEG")
+        except BaseException:
+            f.close()
+            raise
+
+        if passthrough:
+            # already a JPEG, the encoder streams the open file instead of reading it into memory
+            f.seek(0)
+            return f, image_dims
+
+        f.close()
+        buffered.seek(0)
+        return buffered, image_dims
+
     def predict(self, image_path, prediction_type=None, **kwargs):
         """
         Infers detections based on image from a specified model and image path.
@@ -116,57 +294,127 @@ class InferenceModel:
 
             >>> prediction = model.predict("YOUR_IMAGE.jpg")
         """
-        params, request_kwargs, image_dims = self.__get_image_params(image_path)
+        params, request_kwargs, image_dims, upload = self.__get_image_params(image_path)
 
         params["api_key"] = self.__api_key
 
         params.update(**kwargs)
         url = f"{self.api_url}?{urllib.parse.urlencode(params)}"  # type: ignore[attr-defined]
-        response = requests.post(url, **request_kwargs)
+        try:
+            response = self._session.post(url, **request_kwargs)
+        finally:
+            if upload is not None:
+                upload.close()
         response.raise_for_status()
 
         return PredictionGroup.create_prediction_group(
-            response.json(),
+            _response_json(response),
             image_path=image_path,
             prediction_type=prediction_type,
             image_dims=image_dims,
             colors=self.colors,
         )
 
-    def predict_video(
-        self,
-        video_path: str,
-        fps: int = 5,
-        additional_models: list = [],
-        prediction_type: str = "batch-video",
-    ) -> Tuple[str, str, Optional[str]]:
+    def _predict_batch(self, image_paths, batch_size=16, prediction_type=None, **kwargs):
         """
-        Infers detections based on image from specified model and image path.
+        Infers detections on several images, uploading up to batch_size local images per request.
+
+        Shared implementation behind predict_batch on the models whose predict goes through
+        InferenceModel.predict. Batched uploads need server support and are only used when the
+        BATCH_PREDICT_ENABLED configuration variable is set to "true". Otherwise, and for hosted
+        image URLs, each image is sent with its own predict request.
 
         Args:
-            video_path (str): path to the video you'd like to perform prediction on
-            prediction_type (str): type of the model to run
-            fps (int): frames per second to run inference
+            image_paths (list): paths to the images you'd like to perform prediction on
+            batch_size (int): maximum number of images to upload in a single request
+            prediction_type (str): type of prediction to perform
+            **kwargs: Any additional kwargs will be turned into querystring params
 
         Returns:
-            A list of the signed url and job id
+            A list of PredictionGroup objects, in the same order as image_paths
 
-        Example:
-            >>> import roboflow
+        Raises:
+            Exception: Image path is not valid
+        """
+        results = [None] * len(image_paths)
+        local_indexes = []
+        for i, image_path in enumerate(image_paths):
+            if BATCH_PREDICT_ENABLED and not _is_hosted(image_path):
+                local_indexes.append(i)
+            else:
+                results[i] = InferenceModel.predict(self, image_path, prediction_type=prediction_type, **kwargs)
 
-            >>> rf = roboflow.Roboflow(api_key="")
+        params = {**kwargs, "api_key": self.__api_key, "batch": "true"}
+        for start in range(0, len(local_indexes), batch_size):
+            batch = local_indexes[start : start + batch_size]
+            fields = {}
+            batch_dims = []
+            try:
+                for n, i in enumerate(batch):
+                    upload, image_dims = self.__encode_image(image_paths[i])
+                    fields[f"file_{n}"] = (f"imageToUpload_{n}", upload, "image/jpeg")
+                    batch_dims.append(image_dims)
+
+                data = MultipartEncoder(fields=fields)
+                url = f"{self.api_url}?{urllib.parse.urlencode(params)}"  # type: ignore[attr-defined]
+                response = self._session.post(url, data=data, headers={"Content-Type": data.content_type})
+            finally:
+                for _, upload, _ in fields.values():
+                    upload.close()
+            response.raise_for_status()
+
+            batch_responses = _response_json(response)
+            if not isinstance(batch_responses, list) or len(batch_responses) != len(batch):
+                raise Exception(f"Expected {len(batch)} results from batch prediction, got: {response.text}")
+
+            for i, json_response, image_dims in zip(batch, batch_responses, batch_dims):
+                results[i] = PredictionGroup.create_prediction_group(
+                    json_response,
+                    image_path=image_paths[i],
+                    prediction_type=prediction_type,
+                    image_dims=image_dims,
+                    colors=self.colors,
+                )
+
+        return results
+
+    def _predict_many(self, image_paths, max_workers=8, **kwargs):
+        """
+        Runs predict on several images concurrently, one request per image.
 
-            >>> project = rf.workspace().project("PROJECT_ID")
+        Shared implementation behind predict_many on the models whose predict goes through
+        InferenceModel.predict. That predict keeps no per-call state on the model and sends its
+        request through self._session, so the thread pool shares the session's connection pool.
+        The GIL is released while waiting on the network, so the requests overlap.
 
-            >>> model = project.version("1").model
+        Args:
+            image_paths (list): paths to the images you'd like to perform prediction on
+            max_workers (int): maximum number of predict requests in flight at once, capped at
+                        HTTP_POOL_MAXSIZE so every worker can keep a pooled connection
+            **kwargs: Any additional kwargs are passed to predict
 
-            >>> job_id,signed_url,signed_url_expires = model.predict_video("video.mp4"
-                ,fps=5, inference_type="object-detection")
+        Returns:
+            A list of PredictionGroup objects, in the same order as image_paths
         """
+        max_workers = min(max_workers, HTTP_POOL_MAXSIZE)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(lambda image_path: self.predict(image_path, **kwargs), image_paths))
 
-        signed_url_expires = None
+    def __get_video_models(self, fps, additional_models, prediction_type):
+        """
+        Validate video inference options and build the list of models to run on the video.
+
+        Args:
+            fps (int): frames per second to run inference
+            additional_models (list): names of additional models to run alongside this one
+            prediction_type (str): type of the model to run
+
+        Returns:
+            A list of model dicts for the videoinfer request
 
-        url = urljoin(API_URL, "/video_upload_signed_url?api_key=" + self.__api_key)
+        Raises:
+            Exception: An option is not supported for video inference
+        """
         if fps > 120:
             raise Exception("FPS must be less than or equal to 120.")
 
@@ -194,47 +442,6 @@ class InferenceModel:
         else:
             raise Exception("Model type not supported for video inference.")
 
-        payload = json.dumps(
-            {
-                "file_name": os.path.basename(video_path),
-            }
-        )
-
-        if not video_path.startswith(("http://", "https://")):
-            headers = {"Content-Type": "application/json"}
-
-            try:
-                response = requests.request("POST", url, headers=headers, data=payload)
-            except Exception as e:
-                raise Exception(f"Error uploading video: {e}")
-
-            if not response.ok:
-                raise Exception(f"Error uploading video: {response.text}")
-
-            signed_url = response.json()["signed_url"]
-
-            signed_url_expires = signed_url.split("&X-Goog-Expires")[1].split("&")[0].strip("=")
-
-            # make a POST request to the signed URL
-            headers = {"Content-Type": "application/octet-stream"}
-
-            try:
-                with open(video_path, "rb") as f:
-                    video_data = f.read()
-            except Exception as e:
-                raise Exception(f"Error reading video: {e}")
-
-            try:
-                result = requests.put(signed_url, data=video_data, headers=headers)
-            except Exception as e:
-                raise Exception(f"There was an error uploading the video: {e}")
-
-            if not result.ok:
-                raise Exception(f"There was an error uploading the video: {result.text}")
-        else:
-            signed_url = video_path
-
-        url = urljoin(API_URL, "/videoinfer/?api_key=" + self.__api_key)
         if model_class in ("CLIPModel", "GazeModel"):
             if model_class == "CLIPModel":
                 model = "clip"
@@ -260,19 +467,92 @@ class InferenceModel:
         for model in additional_models:
             models.append(SUPPORTED_ADDITIONAL_MODELS[model])
 
-        payload = json.dumps({"input_url": signed_url, "infer_fps": fps, "models": models})
+        return models
+
+    def predict_video(
+        self,
+        video_path: str,
+        fps: int = 5,
+        additional_models: list = [],
+        prediction_type: str = "batch-video",
+    ) -> Tuple[str, str, Optional[str]]:
+        """
+        Infers detections based on image from specified model and image path.
+
+        Args:
+            video_path (str): path to the video you'd like to perform prediction on
+            prediction_type (str): type of the model to run
+            fps (int): frames per second to run inference
+
+        Returns:
+            A list of the signed url and job id
+
+        Example:
+            >>> import roboflow
+
+            >>> rf = roboflow.Roboflow(api_key="")
+
+            >>> project = rf.workspace().project("PROJECT_ID")
 
-        headers = {"Content-Type": "application/json"}
+            >>> model = project.version("1").model
+
+            >>> job_id,signed_url,signed_url_expires = model.predict_video("video.mp4"
+                ,fps=5, inference_type="object-detection")
+        """
+
+        signed_url_expires = None
+
+        models = self.__get_video_models(fps, additional_models, prediction_type)
+
+        if not _is_hosted(video_path):
+            try:
+                response = self._session.post(
+                    self._signed_url_endpoint,
+                    params=self._auth_params,
+                    json={"file_name": os.path.basename(video_path)},
+                )
+            except Exception as e:
+                raise Exception(f"Error uploading video: {e}")
+
+            if not response.ok:
+                raise Exception(f"Error uploading video: {response.text}")
+
+            signed_url = _response_json(response)["signed_url"]
+
+            signed_url_expires = _signed_url_expiry(signed_url)
+
+            # make a POST request to the signed URL
+            headers = {"Content-Type": "application/octet-stream"}
+
+            try:
+                video_size = os.path.getsize(video_path)
+                f = open(video_path, "rb")
+            except Exception as e:
+                raise Exception(f"Error reading video: {e}")
+
+            # stream the file from disk rather than reading it all into memory
+            with f:
+                try:
+                    result = self._session.put(signed_url, data=_FileChunks(f, video_size), headers=headers)
+                except Exception as e:
+                    raise Exception(f"There was an error uploading the video: {e}")
+
+            if not result.ok:
+                raise Exception(f"There was an error uploading the video: {result.text}")
+        else:
+            signed_url = video_path
+
+        payload = {"input_url": signed_url, "infer_fps": fps, "models": models}
 
         try:
-            response = requests.request("POST", url, headers=headers, data=payload)
+            response = self._session.post(self._videoinfer_endpoint, params=self._auth_params, json=payload)
         except Exception as e:
             raise Exception(f"Error starting video inference: {e}")
 
         if not response.ok:
             raise Exception(f"Error starting video inference: {response.text}")
 
-        job_id = response.json()["job_id"]
+        job_id = _response_json(response)["job_id"]
 
         self.job_id = job_id
 
@@ -302,36 +582,45 @@ class InferenceModel:
         if job_id is None:
             job_id = self.job_id
 
-        url = urljoin(API_URL, "/videoinfer/?api_key=" + self.__api_key + "&job_id=" + job_id)
         try:
-            response = requests.get(url, headers={"Content-Type": "application/json"})
+            response = self._session.get(self._videoinfer_endpoint, params={**self._auth_params, "job_id": job_id})
         except Exception as e:
             raise Exception(f"Error getting video inference results: {e}")
 
         if not response.ok:
             raise Exception(f"Error getting video inference results: {response.text}")
-        data = response.json()
-        if "status" not in data:
-            return {}  # No status available
-        if data.get("status") > 1:
-            return data  # Error
-        elif data.get("status") == 1:
-            return {}  # Still running
+        data = _response_json(response)
+        state = _video_job_state(data)
+        if state == "error":
+            return data
+        elif state == "running":
+            return {}
         else:  # done
             output_signed_url = data["output_signed_url"]
-            inference_data = requests.get(output_signed_url, headers={"Content-Type": "application/json"})
+            inference_data = self._session.get(output_signed_url, headers={"Content-Type": "application/json"})
 
             # frame_offset and model name are top-level keys
-            return inference_data.json()
+            return _response_json(inference_data)
 
-    def poll_until_video_results(self, job_id) -> dict:
+    def poll_until_video_results(
+        self,
+        job_id,
+        timeout: Optional[float] = None,
+        should_cancel: Optional[Callable[[], bool]] = None,
+    ) -> dict:
         """
         Polls the Roboflow API to check if video inference is complete.
 
-        When inference is complete, the results are returned.
+        When inference is complete, the results are returned. Polls start a couple of seconds
+        apart and back off exponentially (with jitter) up to VIDEO_POLL_MAX_DELAY seconds.
+
+        Args:
+            job_id (str): the video inference job to wait for, defaults to the last submitted job
+            timeout (float): give up after this many seconds and raise a TimeoutError
+            should_cancel (Callable[[], bool]): called between polls, return True to stop waiting
 
         Returns:
-            Inference results as a dict
+            Inference results as a dict, or an empty dict if polling was cancelled
 
         Example:
             >>> import roboflow
@@ -349,17 +638,192 @@ class InferenceModel:
         if job_id is None:
             job_id = self.job_id
 
-        attempts = 0
-        print(f"Checking for video inference results for job {job_id} every 60s")
+        deadline = None if timeout is None else time.monotonic() + timeout
+        delay = VIDEO_POLL_INITIAL_DELAY
+        print(f"Checking for video inference results for job {job_id}")
         while True:
-            time.sleep(60)
-            print(f"({attempts * 60}s): Checking for inference results")
             response = self.poll_for_video_results(job_id)
-            attempts += 1
-
             if response != {}:
                 return response
 
+            if should_cancel is not None and should_cancel():
+                return {}
+
+            sleep_for, delay = _next_poll_delay(delay, deadline, job_id)
+            time.sleep(sleep_for)
+
+    async def predict_video_async(
+        self,
+        video_path: str,
+        fps: int = 5,
+        additional_models: Optional[list] = None,
+        prediction_type: str = "batch-video",
+        client=None,
+    ) -> Tuple[str, str, Optional[str]]:
+        """
+        Async version of predict_video, built on an httpx.AsyncClient.
+
+        Requires the optional httpx package (`pip install 'httpx[http2]'`).
+
+        Args:
+            video_path (str): path to the video you'd like to perform prediction on
+            fps (int): frames per second to run inference
+            additional_models (list): names of additional models to run alongside this one
+            prediction_type (str): type of the model to run
+            client (httpx.AsyncClient): client to send requests with, share one across many jobs
+                        to reuse its connections. A new client is created and closed if not given.
+
+        Returns:
+            A list of the job id, signed url and signed url expiry
+
+        Example:
+            >>> import roboflow
+
+            >>> rf = roboflow.Roboflow(api_key="")
+
+            >>> project = rf.workspace().project("PROJECT_ID")
+
+            >>> model = project.version("1").model
+
+            >>> job_id, signed_url, signed_url_expires = await model.predict_video_async("video.mp4", fps=5)
+        """
+        signed_url_expires = None
+
+        models = self.__get_video_models(fps, additional_models or [], prediction_type)
+
+        owns_client = client is None
+        if owns_client:
+            client = _new_async_client()
+
+        try:
+            if not _is_hosted(video_path):
+                try:
+                    response = await client.post(
+                        self._signed_url_endpoint,
+                        params=self._auth_params,
+                        json={"file_name": os.path.basename(video_path)},
+                    )
+                except Exception as e:
+                    raise Exception(f"Error uploading video: {e}")
+
+                if not response.is_success:
+                    raise Exception(f"Error uploading video: {response.text}")
+
+                signed_url = _response_json(response)["signed_url"]
+
+                signed_url_expires = _signed_url_expiry(signed_url)
+
+                loop = asyncio.get_running_loop()
+                try:
+                    video_size = await loop.run_in_executor(None, os.path.getsize, video_path)
+                    f = await loop.run_in_executor(None, open, video_path, "rb")
+                except Exception as e:
+                    raise Exception(f"Error reading video: {e}")
+
+                headers = {"Content-Type": "application/octet-stream", "Content-Length": str(video_size)}
+                with f:
+                    try:
+                        result = await client.put(signed_url, content=_aiter_file_chunks(f), headers=headers)
+                    except Exception as e:
+                        raise Exception(f"There was an error uploading the video: {e}")
+
+                if not result.is_success:
+                    raise Exception(f"There was an error uploading the video: {result.text}")
+            else:
+                signed_url = video_path
+
+            payload = {"input_url": signed_url, "infer_fps": fps, "models": models}
+
+            try:
+                response = await client.post(self._videoinfer_endpoint, params=self._auth_params, json=payload)
+            except Exception as e:
+                raise Exception(f"Error starting video inference: {e}")
+
+            if not response.is_success:
+                raise Exception(f"Error starting video inference: {response.text}")
+        finally:
+            if owns_client:
+                await client.aclose()
+
+        job_id = _response_json(response)["job_id"]
+
+        self.job_id = job_id
+
+        return job_id, signed_url, signed_url_expires
+
+    async def poll_until_video_results_async(
+        self,
+        job_id,
+        timeout: Optional[float] = None,
+        client=None,
+    ) -> dict:
+        """
+        Async version of poll_until_video_results, built on an httpx.AsyncClient.
+
+        Requires the optional httpx package (`pip install 'httpx[http2]'`). Polling backs off the
+        same way as poll_until_video_results, and can be stopped by cancelling the awaiting task.
+
+        Args:
+            job_id (str): the video inference job to wait for, defaults to the last submitted job
+            timeout (float): give up after this many seconds and raise a TimeoutError
+            client (httpx.AsyncClient): client to send requests with, share one across many jobs
+                        to reuse its connections. A new client is created and closed if not given.
+
+        Returns:
+            Inference results as a dict
+
+        Example:
+            >>> import roboflow
+
+            >>> rf = roboflow.Roboflow(api_key="")
+
+            >>> project = rf.workspace().project("PROJECT_ID")
+
+            >>> model = project.version("1").model
+
+            >>> job_id, signed_url, signed_url_expires = await model.predict_video_async("video.mp4")
+
+            >>> results = await model.poll_until_video_results_async(job_id)
+        """
+        if job_id is None:
+            job_id = self.job_id
+
+        owns_client = client is None
+        if owns_client:
+            client = _new_async_client()
+
+        try:
+            deadline = None if timeout is None else time.monotonic() + timeout
+            delay = VIDEO_POLL_INITIAL_DELAY
+            while True:
+                try:
+                    response = await client.get(
+                        self._videoinfer_endpoint, params={**self._auth_params, "job_id": job_id}
+                    )
+                except Exception as e:
+                    raise Exception(f"Error getting video inference results: {e}")
+
+                if not response.is_success:
+                    raise Exception(f"Error getting video inference results: {response.text}")
+
+                data = _response_json(response)
+                state = _video_job_state(data)
+                if state == "error":
+                    return data
+                elif state == "done":
+                    inference_data = await client.get(
+                        data["output_signed_url"], headers={"Content-Type": "application/json"}
+                    )
+
+                    # frame_offset and model name are top-level keys
+                    return _response_json(inference_data)
+
+                sleep_for, delay = _next_poll_delay(delay, deadline, job_id)
+                await asyncio.sleep(sleep_for)
+        finally:
+            if owns_client:
+                await client.aclose()
+
     def download(self, format="pt", location="."):
         """
         Download the weights associated with a model.
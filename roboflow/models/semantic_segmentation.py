@@ -46,5 +46,66 @@ class SemanticSegmentationModel(InferenceModel):
             prediction_type=SEMANTIC_SEGMENTATION_MODEL,
         )
 
+    def predict_batch(self, image_paths: list, confidence: int = 50, batch_size: int = 16):
+        """
+        Infers detections on several images from a specified model and image paths.
+
+        Local images are uploaded batch_size at a time when the BATCH_PREDICT_ENABLED configuration
+        variable is set to "true". Otherwise each image is sent with its own predict request.
+
+        Args:
+            image_paths (list): paths to the images you'd like to perform prediction on
+            confidence (int): confidence threshold for predictions, on a scale from 0-100
+            batch_size (int): maximum number of images to upload in a single request
+
+        Returns:
+            A list of PredictionGroup objects, in the same order as image_paths
+
+        Example:
+            >>> import roboflow
+
+            >>> rf = roboflow.Roboflow(api_key="")
+
+            >>> project = rf.workspace().project("PROJECT_ID")
+
+            >>> model = project.version("1").model
+
+            >>> predictions = model.predict_batch(["YOUR_IMAGE_1.jpg", "YOUR_IMAGE_2.jpg"])
+        """
+        return self._predict_batch(
+            image_paths,
+            batch_size=batch_size,
+            confidence=confidence,
+            prediction_type=SEMANTIC_SEGMENTATION_MODEL,
+        )
+
+    def predict_many(self, image_paths: list, confidence: int = 50, max_workers: int = 8):
+        """
+        Infers detections on several images concurrently, one request per image.
+
+        Requests are sent from a thread pool sharing this model's connection pool.
+
+        Args:
+            image_paths (list): paths to the images you'd like to perform prediction on
+            confidence (int): confidence threshold for predictions, on a scale from 0-100
+            max_workers (int): maximum number of predict requests in flight at once, capped at
+                        HTTP_POOL_MAXSIZE
+
+        Returns:
+            A list of PredictionGroup objects, in the same order as image_paths
+
+        Example:
+            >>> import roboflow
+
+            >>> rf = roboflow.Roboflow(api_key="")
+
+            >>> project = rf.workspace().project("PROJECT_ID")
+
+            >>> model = project.version("1").model
+
+            >>> predictions = model.predict_many(["YOUR_IMAGE_1.jpg", "YOUR_IMAGE_2.jpg"])
+        """
+        return self._predict_many(image_paths, max_workers=max_workers, confidence=confidence)
+
     def __str__(self):
         return f"<{type(self).__name__} id={self.id}, api_url={self.api_url}>"
@@ -1,4 +1,3 @@
-import json
 import time
 from typing import Optional, Tuple
 from urllib.parse import urljoin
@@ -113,15 +112,7 @@ class VideoInferenceModel(InferenceModel):
         if not is_valid_video(video_path):
             raise Exception("Video path is not valid")
 
-        payload = json.dumps(
-            {
-                "file_name": video_path,
-            }
-        )
-
-        headers = {"Content-Type": "application/json"}
-
-        response = requests.request("POST", url, headers=headers, data=payload)
+        response = requests.post(url, json={"file_name": video_path})
 
         signed_url = response.json()["signed_url"]
 
@@ -140,9 +131,9 @@ class VideoInferenceModel(InferenceModel):
         for model in additional_models:
             models.append(SUPPORTED_ADDITIONAL_MODELS[model])
 
-        payload = json.dumps({"input_url": signed_url, "infer_fps": fps, "models": models})
+        payload = {"input_url": signed_url, "infer_fps": fps, "models": models}
 
-        response = requests.request("POST", url, headers=headers, data=payload)
+        response = requests.post(url, json=payload)
 
         job_id = response.json()["job_id"]
 
@@ -174,7 +165,7 @@ class VideoInferenceModel(InferenceModel):
         if job_id is None:
             job_id = self.job_id
 
-        url = urljoin(API_URL, f"/videoinfer/?api_key={self.__api_key}&job_id={self.job_id}")
+        url = urljoin(API_URL, f"/videoinfer/?api_key={self.__api_key}&job_id={job_id}")
 
         try:
             response = requests.get(url, headers={"Content-Type": "application/json"})
@@ -228,7 +219,7 @@ class VideoInferenceModel(InferenceModel):
         attempts = 0
 
         while True:
-            response = self.poll_for_results()
+            response = self.poll_for_results(job_id)
 
             attempts += 1
 
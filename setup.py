@@ -30,8 +30,12 @@ setuptools.setup(
     # create optional [desktop]
     extras_require={
         "desktop": ["opencv-python==4.8.0.74"],
+        "async": ["httpx[http2]"],
+        "orjson": ["orjson"],
         "dev": [
+            "httpx[http2]",
             "mypy",
+            "orjson",
             "responses",
             "ruff",
             "twine",
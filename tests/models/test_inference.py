@@ -0,0 +1,389 @@
+import io
+import json
+import os
+import sys
+import tempfile
+import threading
+import unittest
+from unittest.mock import patch
+
+import responses
+from PIL import Image
+from requests_toolbelt.multipart.encoder import MultipartEncoder
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+from roboflow.config import API_URL
+from roboflow.models.inference import (
+    HTTP_POOL_MAXSIZE,
+    VIDEO_POLL_MAX_DELAY,
+    InferenceModel,
+    _new_async_client,
+    _video_job_state,
+)
+from roboflow.models.instance_segmentation import InstanceSegmentationModel
+
+MOCK_RESULTS = {"frame_offset": [0], "test-123": []}
+
+MOCK_PREDICTION = {"predictions": [], "image": {"width": 1333, "height": 1000}}
+
+
+def _uploaded_file(request):
+    body = request.body.read() if hasattr(request.body, "read") else request.body
+    return body.split(b"\r\n\r\n", 1)[1].rsplit(b"\r\n--", 1)[0]
+
+
+class TestPredictImageUpload(unittest.TestCase):
+    api_key = "my-api-key"
+    version_id = "roboflow/test-123/23"
+    api_url = "https://outline.roboflow.com/test-123/23"
+
+    @responses.activate
+    def test_jpeg_is_uploaded_unchanged(self):
+        image_path = "tests/images/rabbit.JPG"
+        model = InstanceSegmentationModel(self.api_key, self.version_id)
+        responses.add(responses.POST, self.api_url, json=MOCK_PREDICTION)
+
+        model.predict(image_path)
+
+        with open(image_path, "rb") as f:
+            self.assertEqual(_uploaded_file(responses.calls[0].request), f.read())
+
+    @responses.activate
+    def test_jpeg_is_streamed_from_the_open_file(self):
+        model = InstanceSegmentationModel(self.api_key, self.version_id)
+        responses.add(responses.POST, self.api_url, json=MOCK_PREDICTION)
+
+        with patch("roboflow.models.inference.MultipartEncoder", wraps=MultipartEncoder) as encoder:
+            model.predict("tests/images/rabbit.JPG")
+
+        upload = encoder.call_args.kwargs["fields"]["file"][1]
+        self.assertIsInstance(upload, io.BufferedReader)
+        self.assertTrue(upload.closed)
+
+    @responses.activate
+    def test_jpeg_with_exif_orientation_is_re_encoded(self):
+        model = InstanceSegmentationModel(self.api_key, self.version_id)
+        responses.add(responses.POST, self.api_url, json=MOCK_PREDICTION)
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            image_path = os.path.join(tmp_dir, "rotated.jpg")
+            exif = Image.Exif()
+            exif[0x0112] = 6
+            Image.new("RGB", (32, 24)).save(image_path, exif=exif)
+            model.predict(image_path)
+            with open(image_path, "rb") as f:
+                original = f.read()
+
+        uploaded = _uploaded_file(responses.calls[0].request)
+        self.assertNotEqual(uploaded, original)
+        with Image.open(io.BytesIO(uploaded)) as image:
+            self.assertEqual(image.format, "JPEG")
+            self.assertIsNone(image.getexif().get(0x0112))
+
+    @responses.activate
+    def test_other_formats_are_converted_to_jpeg(self):
+        model = InstanceSegmentationModel(self.api_key, self.version_id)
+        responses.add(responses.POST, self.api_url, json=MOCK_PREDICTION)
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            image_path = os.path.join(tmp_dir, "image.png")
+            Image.new("RGB", (32, 24)).save(image_path)
+            model.predict(image_path)
+
+        self.assertTrue(_uploaded_file(responses.calls[0].request).startswith(b"\xff\xd8"))
+
+    @responses.activate
+    def test_parses_response_without_orjson(self):
+        model = InstanceSegmentationModel(self.api_key, self.version_id)
+        responses.add(responses.POST, self.api_url, json=MOCK_PREDICTION)
+
+        with patch("roboflow.models.inference.orjson", None):
+            group = model.predict("tests/images/rabbit.JPG")
+
+        self.assertEqual(group.base_image_path, "tests/images/rabbit.JPG")
+
+    @responses.activate
+    def test_parses_response_with_orjson(self):
+        model = InstanceSegmentationModel(self.api_key, self.version_id)
+        responses.add(responses.POST, self.api_url, json=MOCK_PREDICTION)
+
+        with patch("roboflow.models.inference.orjson") as orjson:
+            orjson.loads.return_value = MOCK_PREDICTION
+            model.predict("tests/images/rabbit.JPG")
+
+        orjson.loads.assert_called_once_with(json.dumps(MOCK_PREDICTION).encode())
+
+    def test_missing_image_raises(self):
+        model = InstanceSegmentationModel(self.api_key, self.version_id)
+
+        with self.assertRaisesRegex(Exception, "Image does not exist"):
+            model.predict("tests/images/does-not-exist.jpg")
+
+
+class TestPredictBatch(unittest.TestCase):
+    api_key = "my-api-key"
+    version_id = "roboflow/test-123/23"
+    api_url = "https://outline.roboflow.com/test-123/23"
+    image_paths = ["tests/images/rabbit.JPG", "tests/images/rabbit2.jpg"]
+
+    @responses.activate
+    def test_sends_one_request_per_image_when_disabled(self):
+        model = InstanceSegmentationModel(self.api_key, self.version_id)
+        responses.add(responses.POST, self.api_url, json=MOCK_PREDICTION)
+
+        groups = model.predict_batch(self.image_paths)
+
+        self.assertEqual(len(groups), 2)
+        self.assertEqual(len(responses.calls), 2)
+        self.assertNotIn("batch", responses.calls[0].request.params)
+
+    @responses.activate
+    @patch("roboflow.models.inference.BATCH_PREDICT_ENABLED", True)
+    def test_uploads_images_together_when_enabled(self):
+        model = InstanceSegmentationModel(self.api_key, self.version_id)
+        responses.add(responses.POST, self.api_url, json=[MOCK_PREDICTION, MOCK_PREDICTION])
+
+        groups = model.predict_batch(self.image_paths)
+
+        self.assertEqual([group.base_image_path for group in groups], self.image_paths)
+        self.assertEqual(len(responses.calls), 1)
+        self.assertEqual(responses.calls[0].request.params["batch"], "true")
+
+    @responses.activate
+    @patch("roboflow.models.inference.BATCH_PREDICT_ENABLED", True)
+    def test_splits_into_batches(self):
+        model = InstanceSegmentationModel(self.api_key, self.version_id)
+        responses.add(responses.POST, self.api_url, json=[MOCK_PREDICTION])
+
+        groups = model.predict_batch(self.image_paths, batch_size=1)
+
+        self.assertEqual(len(groups), 2)
+        self.assertEqual(len(responses.calls), 2)
+
+
+class TestPredictMany(unittest.TestCase):
+    api_key = "my-api-key"
+    version_id = "roboflow/test-123/23"
+    api_url = "https://outline.roboflow.com/test-123/23"
+    image_paths = ["tests/images/rabbit.JPG", "tests/images/rabbit2.jpg", "tests/images/classify.jpg"]
+
+    def test_local_server_uses_the_sized_pool(self):
+        model = InstanceSegmentationModel(self.api_key, self.version_id, local="http://localhost:9001")
+
+        for url in ("http://localhost:9001/test-123/23", self.api_url):
+            self.assertEqual(model._session.get_adapter(url)._pool_maxsize, HTTP_POOL_MAXSIZE)
+
+    @responses.activate
+    def test_returns_results_in_order(self):
+        model = InstanceSegmentationModel(self.api_key, self.version_id)
+        responses.add(responses.POST, self.api_url, json=MOCK_PREDICTION)
+
+        groups = model.predict_many(self.image_paths, max_workers=2)
+
+        self.assertEqual([group.base_image_path for group in groups], self.image_paths)
+        self.assertEqual(len(responses.calls), 3)
+        for call in responses.calls:
+            self.assertEqual(call.request.params["confidence"], "40")
+
+    @responses.activate
+    def test_requests_overlap(self):
+        model = InstanceSegmentationModel(self.api_key, self.version_id)
+        # every request waits here until all of them are in flight, so a serial loop would time out
+        barrier = threading.Barrier(len(self.image_paths), timeout=5)
+
+        def callback(request):
+            barrier.wait()
+            return 200, {}, json.dumps(MOCK_PREDICTION)
+
+        responses.add_callback(responses.POST, self.api_url, callback=callback)
+
+        groups = model.predict_many(self.image_paths, max_workers=len(self.image_paths))
+
+        self.assertEqual(len(groups), len(self.image_paths))
+        self.assertFalse(barrier.broken)
+
+
+class TestPredictVideo(unittest.TestCase):
+    api_key = "my-api-key"
+    version_id = "roboflow/test-123/23"
+    signed_url = "https://storage.example.com/video.mp4?X-Goog-Date=20240101&X-Goog-Expires=900&X-Goog-Signature=abc"
+
+    @responses.activate
+    def test_uploads_video_and_starts_job(self):
+        model = InstanceSegmentationModel(self.api_key, self.version_id)
+        responses.add(responses.POST, f"{API_URL}/video_upload_signed_url", json={"signed_url": self.signed_url})
+        responses.add(responses.PUT, self.signed_url)
+        responses.add(responses.POST, f"{API_URL}/videoinfer/", json={"job_id": "job-1"})
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            video_path = os.path.join(tmp_dir, "video.mp4")
+            with open(video_path, "wb") as f:
+                f.write(b"\0" * 1024)
+            job_id, signed_url, expires = model.predict_video(video_path, fps=5)
+
+        self.assertEqual((job_id, signed_url, expires), ("job-1", self.signed_url, "900"))
+        self.assertEqual(model.job_id, "job-1")
+
+        signed_url_request, upload_request, infer_request = (call.request for call in responses.calls)
+        self.assertEqual(signed_url_request.params, {"api_key": self.api_key})
+        self.assertEqual(json.loads(signed_url_request.body), {"file_name": "video.mp4"})
+        self.assertEqual(upload_request.headers["Content-Length"], "1024")
+        self.assertEqual(infer_request.params, {"api_key": self.api_key})
+        self.assertEqual(
+            json.loads(infer_request.body),
+            {
+                "input_url": self.signed_url,
+                "infer_fps": 5,
+                "models": [{"model_id": "test-123", "model_version": "23", "inference_type": "instance-segmentation"}],
+            },
+        )
+
+
+class TestPollForVideoResults(unittest.TestCase):
+    api_key = "my-api-key"
+    version_id = "roboflow/test-123/23"
+
+    @responses.activate
+    def test_polls_the_given_job_id(self):
+        model = InstanceSegmentationModel(self.api_key, self.version_id)
+        model.job_id = "job-1"
+        responses.add(
+            responses.GET, f"{API_URL}/videoinfer/", json={"status": 0, "output_signed_url": "https://example.com/out"}
+        )
+        responses.add(responses.GET, "https://example.com/out", json=MOCK_RESULTS)
+
+        results = model.poll_for_video_results("job-2")
+
+        self.assertEqual(results, MOCK_RESULTS)
+        self.assertEqual(responses.calls[0].request.params["job_id"], "job-2")
+
+    @responses.activate
+    def test_still_running_returns_empty_dict(self):
+        model = InstanceSegmentationModel(self.api_key, self.version_id)
+        responses.add(responses.GET, f"{API_URL}/videoinfer/", json={"status": 1})
+
+        self.assertEqual(model.poll_for_video_results("job-1"), {})
+
+
+class TestVideoJobState(unittest.TestCase):
+    def test_maps_status_payloads(self):
+        self.assertEqual(_video_job_state({}), "running")
+        self.assertEqual(_video_job_state({"status": 1}), "running")
+        self.assertEqual(_video_job_state({"status": 0}), "done")
+        self.assertEqual(_video_job_state({"status": 2}), "error")
+
+
+class TestPollUntilVideoResults(unittest.TestCase):
+    api_key = "my-api-key"
+    version_id = "roboflow/test-123/23"
+
+    def setUp(self):
+        super().setUp()
+        self.model = InstanceSegmentationModel(self.api_key, self.version_id)
+
+    @patch("roboflow.models.inference.time.sleep")
+    @patch.object(InferenceModel, "poll_for_video_results")
+    def test_returns_without_sleeping_when_results_are_ready(self, mock_poll, mock_sleep):
+        mock_poll.return_value = MOCK_RESULTS
+
+        results = self.model.poll_until_video_results("job-1")
+
+        self.assertEqual(results, MOCK_RESULTS)
+        mock_poll.assert_called_once_with("job-1")
+        mock_sleep.assert_not_called()
+
+    @patch("roboflow.models.inference.time.sleep")
+    @patch.object(InferenceModel, "poll_for_video_results")
+    def test_backs_off_between_polls(self, mock_poll, mock_sleep):
+        mock_poll.side_effect = [{}] * 12 + [MOCK_RESULTS]
+
+        results = self.model.poll_until_video_results("job-1")
+
+        self.assertEqual(results, MOCK_RESULTS)
+        delays = [call.args[0] for call in mock_sleep.call_args_list]
+        self.assertEqual(len(delays), 12)
+        self.assertLess(delays[0], delays[3])
+        self.assertTrue(all(delay <= VIDEO_POLL_MAX_DELAY * 1.2 for delay in delays))
+
+    @patch("roboflow.models.inference.time.sleep")
+    @patch.object(InferenceModel, "poll_for_video_results")
+    def test_should_cancel_stops_polling(self, mock_poll, mock_sleep):
+        mock_poll.return_value = {}
+
+        results = self.model.poll_until_video_results("job-1", should_cancel=lambda: True)
+
+        self.assertEqual(results, {})
+        mock_sleep.assert_not_called()
+
+    @patch("roboflow.models.inference.time.sleep")
+    @patch.object(InferenceModel, "poll_for_video_results")
+    def test_timeout_raises(self, mock_poll, mock_sleep):
+        mock_poll.return_value = {}
+
+        with self.assertRaises(TimeoutError):
+            self.model.poll_until_video_results("job-1", timeout=0)
+
+
+@unittest.skipIf(httpx is None, "httpx is not installed")
+class TestNewAsyncClient(unittest.IsolatedAsyncioTestCase):
+    async def test_falls_back_to_http1_without_h2(self):
+        with patch.dict(sys.modules, {"h2": None}):
+            client = _new_async_client()
+
+        self.assertIsInstance(client, httpx.AsyncClient)
+        await client.aclose()
+
+
+@unittest.skipIf(httpx is None, "httpx is not installed")
+class TestAsyncVideoInference(unittest.IsolatedAsyncioTestCase):
+    api_key = "my-api-key"
+    version_id = "roboflow/test-123/23"
+    signed_url = "https://storage.example.com/video.mp4?X-Goog-Date=20240101&X-Goog-Expires=900&X-Goog-Signature=abc"
+
+    async def test_predict_video_async_uploads_video_and_starts_job(self):
+        requests_seen = []
+
+        def handler(request):
+            requests_seen.append((request, request.read()))
+            if request.url.path == "/video_upload_signed_url":
+                return httpx.Response(200, json={"signed_url": self.signed_url})
+            if request.url.host == "storage.example.com":
+                return httpx.Response(200)
+            return httpx.Response(200, json={"job_id": "job-1"})
+
+        model = InstanceSegmentationModel(self.api_key, self.version_id)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            video_path = os.path.join(tmp_dir, "video.mp4")
+            with open(video_path, "wb") as f:
+                f.write(b"\0" * 1024)
+            async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+                job_id, signed_url, expires = await model.predict_video_async(video_path, client=client)
+
+        self.assertEqual((job_id, signed_url, expires), ("job-1", self.signed_url, "900"))
+        (_, signed_url_body), (upload_request, upload_body), (infer_request, infer_body) = requests_seen
+        self.assertEqual(json.loads(signed_url_body), {"file_name": "video.mp4"})
+        self.assertEqual(upload_request.headers["Content-Length"], "1024")
+        self.assertEqual(upload_body, b"\0" * 1024)
+        self.assertEqual(infer_request.url.params["api_key"], self.api_key)
+        self.assertEqual(json.loads(infer_body)["infer_fps"], 5)
+
+    @patch("roboflow.models.inference.asyncio.sleep")
+    async def test_poll_until_video_results_async_waits_for_completion(self, mock_sleep):
+        statuses = iter([{"status": 1}, {"status": 1}, {"status": 0, "output_signed_url": "https://example.com/out"}])
+
+        def handler(request):
+            if request.url.host == "example.com":
+                return httpx.Response(200, json=MOCK_RESULTS)
+            self.assertEqual(request.url.params["job_id"], "job-1")
+            return httpx.Response(200, json=next(statuses))
+
+        model = InstanceSegmentationModel(self.api_key, self.version_id)
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            results = await model.poll_until_video_results_async("job-1", client=client)
+
+        self.assertEqual(results, MOCK_RESULTS)
+        self.assertEqual(mock_sleep.call_count, 2)
@@ -102,19 +102,31 @@ class TestInstanceSegmentation(unittest.TestCase):
         }
         instance = InstanceSegmentationModel(self.api_key, self.version_id)
 
-        # Mock the library validating that the URL is valid before sending to the API
-        responses.add(responses.HEAD, image_path)
         responses.add(responses.POST, self.api_url, json=MOCK_RESPONSE)
 
         instance.predict(image_path)
 
-        request = responses.calls[1].request
+        request = responses.calls[0].request
 
         self.assertEqual(request.method, "POST")
         self.assertRegex(request.url, rf"^{self.api_url}")
         self.assertDictEqual(request.params, expected_params)
         self.assertIsNone(request.body)
 
+    @responses.activate
+    def test_predict_with_hosted_image_upper_case_scheme(self):
+        image_path = "HTTPS://example.com/raccoon.JPG"
+        instance = InstanceSegmentationModel(self.api_key, self.version_id)
+
+        responses.add(responses.POST, self.api_url, json=MOCK_RESPONSE)
+
+        instance.predict(image_path)
+
+        request = responses.calls[0].request
+
+        self.assertDictEqual(request.params, {**self._default_params, "image": image_path})
+        self.assertIsNone(request.body)
+
     @responses.activate
     def test_predict_with_confidence_request(self):
         confidence = "100"
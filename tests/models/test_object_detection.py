@@ -52,6 +52,18 @@ class TestObjectDetection(unittest.TestCase):
         # self.assertEqual(instance.api_url,
         # f"{OBJECT_DETECTION_URL}/{self.dataset_id}/{self.version}")
 
+    def test_does_not_offer_batch_prediction(self):
+        # predict_batch builds on InferenceModel.predict, which this model's base64 endpoint does not use
+        instance = ObjectDetectionModel(self.api_key, self.version_id, version=self.version)
+
+        self.assertFalse(hasattr(instance, "predict_batch"))
+
+    def test_does_not_offer_concurrent_prediction(self):
+        # this model's predict rewrites api_url and other attributes on every call, so it is not thread safe
+        instance = ObjectDetectionModel(self.api_key, self.version_id, version=self.version)
+
+        self.assertFalse(hasattr(instance, "predict_many"))
+
     @responses.activate
     def test_predict_returns_prediction_group(self):
         print(self.api_url)
@@ -86,13 +86,11 @@ class TestSemanticSegmentation(unittest.TestCase):
         }
         instance = SemanticSegmentationModel(self.api_key, self.version_id)
 
-        # Mock the library validating that the URL is valid before sending to the API
-        responses.add(responses.HEAD, image_path)
         responses.add(responses.POST, self.api_url, json=MOCK_RESPONSE)
 
         instance.predict(image_path)
 
-        request = responses.calls[1].request
+        request = responses.calls[0].request
 
         self.assertEqual(request.method, "POST")
         self.assertRegex(request.url, rf"^{self.api_url}")
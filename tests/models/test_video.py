@@ -0,0 +1,40 @@
+import unittest
+
+import responses
+
+from roboflow.config import API_URL
+from roboflow.models.video import VideoInferenceModel
+
+MOCK_RESULTS = {"frame_offset": [0], "test-123": []}
+
+
+class TestVideoInferenceModel(unittest.TestCase):
+    api_key = "my-api-key"
+
+    @responses.activate
+    def test_poll_for_results_polls_the_given_job_id(self):
+        model = VideoInferenceModel(self.api_key)
+        model.job_id = "job-1"
+        responses.add(
+            responses.GET, f"{API_URL}/videoinfer/", json={"success": 0, "output_signed_url": "https://example.com/out"}
+        )
+        responses.add(responses.GET, "https://example.com/out", json=MOCK_RESULTS)
+
+        results = model.poll_for_results("job-2")
+
+        self.assertEqual(results, MOCK_RESULTS)
+        self.assertEqual(responses.calls[0].request.params, {"api_key": self.api_key, "job_id": "job-2"})
+
+    @responses.activate
+    def test_poll_until_results_polls_the_given_job_id(self):
+        model = VideoInferenceModel(self.api_key)
+        model.job_id = "job-1"
+        responses.add(
+            responses.GET, f"{API_URL}/videoinfer/", json={"success": 0, "output_signed_url": "https://example.com/out"}
+        )
+        responses.add(responses.GET, "https://example.com/out", json=MOCK_RESULTS)
+
+        results = model.poll_until_results("job-2")
+
+        self.assertEqual(results, MOCK_RESULTS)
+        self.assertEqual(responses.calls[0].request.params["job_id"], "job-2")